@@ -1,9 +1,12 @@
 import os
 import re
 import sys
+import asyncio
 import subprocess
 import argparse
-from datetime import datetime
+import functools
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
 import json
 
 # --- DEPENDENCY CHECK ---
@@ -22,49 +25,188 @@ HOME_DIR = os.path.expanduser("~")
 SEARCH_DIRECTORIES = [
     os.path.join(HOME_DIR, "PROJECTS"),
 ]
-
-def run_command(command, cwd, timeout=30):
-    """Runs a shell command and returns its output, handling errors and timeouts."""
+# Directory names that are never searched for repos. Hidden directories
+# (starting with '.') are always skipped.
+SKIP_DIRECTORIES = {"node_modules", "__pycache__", ".venv"}
+
+# Maximum number of repos whose git queries run at the same time.
+MAX_CONCURRENT_REPOS = 64
+
+# The audit is read-only, so stop git status from taking the index lock for
+# its opportunistic index refresh.
+_GIT_ENV = {**os.environ, 'GIT_OPTIONAL_LOCKS': '0'}
+
+# Patterns used for every repo, compiled once.
+_AHEAD_RE = re.compile(r'ahead (\d+)')
+_BEHIND_RE = re.compile(r'behind (\d+)')
+_INS_RE = re.compile(r'(\d+) insertion')
+_DEL_RE = re.compile(r'(\d+) deletion')
+# A git config section header such as [remote "origin"], and a key line such as url = ...
+_CONFIG_SECTION_RE = re.compile(r'\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+_CONFIG_KEY_RE = re.compile(r'([A-Za-z][A-Za-z0-9-]*)\s*(?:=(.*))?$')
+
+def run_command(argv, cwd, timeout=30):
+    """Runs a command (given as an argument list) and returns its output, handling errors and timeouts."""
     try:
         result = subprocess.run(
-            command, cwd=cwd, shell=True, check=True,
+            argv, cwd=cwd, check=True, env=_GIT_ENV,
             stdout=subprocess.PIPE, stderr=subprocess.PIPE,
             text=True, encoding='utf-8', timeout=timeout
         )
         return result.stdout.strip()
-    except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as e:
+    except (OSError, subprocess.TimeoutExpired, subprocess.CalledProcessError) as e:
         # Return stderr if available, otherwise a generic error
-        error_output = e.stderr.strip() if hasattr(e, 'stderr') else "Command Failed"
+        error_output = e.stderr.strip() if getattr(e, 'stderr', None) else "Command Failed"
         return f"ERROR: {error_output}"
 
+async def _run(argv, cwd, timeout=30):
+    """Async counterpart of run_command, run on the event loop with the same output and ERROR conventions."""
+    # An OSError from spawning is not caught here: if git can't be started at all, every
+    # query would fail the same way and the report would show every repo as clean
+    proc = await asyncio.create_subprocess_exec(
+        *argv, cwd=cwd, env=_GIT_ENV,
+        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return "ERROR: Command Failed"
+    if proc.returncode != 0:
+        return f"ERROR: {stderr.decode('utf-8', errors='replace').strip() or 'Command Failed'}"
+    return stdout.decode('utf-8', errors='replace').strip()
+
+def _scan_for_repos(path):
+    """Yields the git repositories under path, without descending into a repo once found."""
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.name == '.git' and entry.is_dir():
+                        yield current
+                        subdirs = [] # Don't go deeper into this directory
+                        break
+                    if (entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.')
+                            and entry.name not in SKIP_DIRECTORIES):
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+        # Reversed so the stack visits subdirectories in listing order
+        stack.extend(reversed(subdirs))
+
 def find_all_repos(search_paths):
-    """Recursively finds all git repositories in the given search paths."""
-    found_repos = []
+    """Recursively finds all git repositories in the given search paths, yielding each as it is found."""
     print(f"Searching for repositories in: {', '.join(search_paths)}")
     for path in search_paths:
         if not os.path.isdir(path):
             print(f"Warning: Directory not found, skipping: {path}", file=sys.stderr)
             continue
-        for root, dirs, _ in os.walk(path):
-            if '.git' in dirs:
-                repo_name = os.path.basename(root)
-                found_repos.append({'name': repo_name, 'path': root})
-                dirs[:] = [] # Don't go deeper into this directory
-    return found_repos
+        for root in _scan_for_repos(path):
+            yield {'name': os.path.basename(root), 'path': root}
+
+# The per-repo summary queries, run concurrently by _collect_one.
+STATUS_QUERY = ["git", "status", "-s"]
+# One line per local branch: current-branch marker, ISO 8601 committer date, upstream ahead/behind
+REFS_QUERY = ["git", "for-each-ref", "--format=%(HEAD)|%(committerdate:iso-strict)|%(upstream:track)", "refs/heads"]
+
+def _parse_git_config_value(raw):
+    """Unquotes a git config value, dropping any trailing comment."""
+    value = []
+    in_quotes = False
+    i = 0
+    while i < len(raw):
+        char = raw[i]
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char in '#;' and not in_quotes:
+            break
+        elif char == '\\' and i + 1 < len(raw):
+            i += 1
+            value.append({'n': '\n', 't': '\t'}.get(raw[i], raw[i]))
+        else:
+            value.append(char)
+        i += 1
+    return ''.join(value).strip()
+
+def _read_git_config(path, depth=0):
+    """Returns a git config file's (section, subsection, key, value) entries, or None if it can't be read."""
+    # Lines that can't be parsed are skipped rather than failing the whole file, since
+    # global config files are often edited by hand.
+    try:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+
+    entries = []
+    section = subsection = None
+    for line in lines:
+        line = line.strip()
+        header_match = _CONFIG_SECTION_RE.match(line)
+        if header_match:
+            section, subsection = header_match.group(1).lower(), header_match.group(2)
+            if subsection is not None:
+                subsection = re.sub(r'\\(.)', r'\1', subsection)
+            elif '.' in section:
+                # Legacy [section.subsection] form
+                section, subsection = section.split('.', 1)
+            line = line[header_match.end():].strip()
+        key_match = _CONFIG_KEY_RE.match(line)
+        if not key_match or section is None:
+            continue
+        key = key_match.group(1).lower()
+        # A key with no '=' is a boolean set to true
+        value = _parse_git_config_value(key_match.group(2)) if key_match.group(2) is not None else 'true'
+        if section == 'include' and subsection is None and key == 'path':
+            # Included files are expanded in place, as git does
+            if depth < 10:
+                include_path = os.path.join(os.path.dirname(path), os.path.expanduser(value))
+                entries.extend(_read_git_config(include_path, depth + 1) or [])
+            continue
+        entries.append((section, subsection, key, value))
+    return entries
+
+@functools.lru_cache(maxsize=None)
+def _read_global_git_config():
+    """Returns the entries of the user's global git config files, read once per run."""
+    xdg_config_home = os.environ.get('XDG_CONFIG_HOME') or os.path.join(HOME_DIR, '.config')
+    entries = []
+    for path in [os.path.join(xdg_config_home, 'git', 'config'), os.path.join(HOME_DIR, '.gitconfig')]:
+        entries.extend(_read_git_config(path) or [])
+    return entries
 
 def get_repo_location(repo_path):
-    """Detects if a repo is from GitHub or Azure DevOps by inspecting its remote URL."""
-    remote_output = run_command("git remote -v", repo_path)
-    if "ERROR" in remote_output:
+    """Detects if a repo is from GitHub or Azure DevOps by reading its origin URL from the git config files."""
+    repo_entries = _read_git_config(os.path.join(repo_path, '.git', 'config'))
+    if repo_entries is None:
         return "Unknown"
 
-    for line in remote_output.split('\n'):
-        if 'origin' in line and 'fetch' in line:
-            url = line.split()[1]
-            if 'github.com' in url:
-                return "GitHub"
-            if 'dev.azure.com' in url or 'visualstudio.com' in url:
-                return "Azure"
+    # Same order as git: global config first, then the repo's own settings
+    url = ''
+    rewrites = []
+    for section, subsection, key, value in _read_global_git_config() + repo_entries:
+        if section == 'remote' and subsection == 'origin' and key == 'url' and not url:
+            # git fetches from the first url configured for a remote
+            url = value
+        elif section == 'url' and subsection is not None and key == 'insteadof':
+            rewrites.append((value, subsection))
+
+    # Apply url.<base>.insteadOf rewrites like git does, using the longest matching prefix
+    matched_prefix, matched_base = '', ''
+    for prefix, base in rewrites:
+        if prefix and url.startswith(prefix) and len(prefix) > len(matched_prefix):
+            matched_prefix, matched_base = prefix, base
+    if matched_prefix:
+        url = matched_base + url[len(matched_prefix):]
+
+    if 'github.com' in url:
+        return "GitHub"
+    if 'dev.azure.com' in url or 'visualstudio.com' in url:
+        return "Azure"
     
     # Fallback: check path for clues
     if 'devops' in repo_path.lower():
@@ -74,17 +216,48 @@ def get_repo_location(repo_path):
         
     return "Other"
 
-def get_last_commit_date(repo_path):
-    """Gets the author date of the last commit."""
-    command = 'git log -1 --format="%cI"' # ISO 8601 date
-    output = run_command(command, repo_path)
-    if "ERROR" in output or not output:
+def parse_current_branch(refs_output):
+    """Parses the for-each-ref output to get the current branch's last commit date, ahead and behind counts."""
+    if "ERROR" in refs_output:
+        return None, 0, 0
+
+    for line in refs_output.split('\n'):
+        if line.startswith('*'):
+            _, date_output, track = line.split('|', 2)
+            ahead_match = _AHEAD_RE.search(track)
+            behind_match = _BEHIND_RE.search(track)
+            ahead = int(ahead_match.group(1)) if ahead_match else 0
+            behind = int(behind_match.group(1)) if behind_match else 0
+            return parse_commit_date(date_output), ahead, behind
+    return None, 0, 0
+
+def parse_commit_date(log_output):
+    """Parses the ISO 8601 committer date of the last commit."""
+    if "ERROR" in log_output or not log_output:
         return None
     try:
-        return datetime.fromisoformat(output)
+        return datetime.fromisoformat(log_output)
     except (ValueError, IndexError):
         return None
 
+def get_last_commit_date(repo_path):
+    """Reads the last commit date from .git/logs/HEAD, or None if the last HEAD update wasn't a commit."""
+    try:
+        with open(os.path.join(repo_path, '.git', 'logs', 'HEAD'), 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - 4096))
+            last_line = f.read().splitlines()[-1]
+        # Format: <old> <new> <name> <email> <timestamp> <tz>\t<message>
+        header, message = last_line.split(b'\t', 1)
+        # Checkouts, pulls and resets also move HEAD, but only a commit entry carries the commit's own date
+        if not message.startswith(b'commit'):
+            return None
+        timestamp, tz = header.rsplit(b' ', 2)[-2:]
+        offset = timedelta(hours=int(tz[1:3]), minutes=int(tz[3:5]))
+        return datetime.fromtimestamp(int(timestamp), timezone(-offset if tz[:1] == b'-' else offset))
+    except (OSError, ValueError, IndexError):
+        return None
+
 def get_short_relative_path(full_path, cwd):
     """Creates a truncated path relative to the current working directory."""
     try:
@@ -95,65 +268,91 @@ def get_short_relative_path(full_path, cwd):
     if relative_path == '.':
         return os.path.basename(full_path)
 
-    parts = relative_path.split(os.sep)
-    truncated_parts = []
-    for part in parts:
-        truncated_parts.append(f"{part[:6]}..." if len(part) > 6 else part)
-    
-    return os.path.join("./", *truncated_parts)
+    return "./" + "/".join(f"{part[:6]}..." if len(part) > 6 else part for part in relative_path.split(os.sep))
+
+async def _collect_one(repo, cwd, semaphore):
+    """Gathers concise status data for a single repository."""
+    path = repo['path']
+    relative_path_home = os.path.relpath(path, HOME_DIR)
+    async with semaphore:
+        status_output, refs_output = await asyncio.gather(_run(STATUS_QUERY, path), _run(REFS_QUERY, path))
+        commit_date, ahead, behind = parse_current_branch(refs_output)
+        if commit_date is None:
+            # A detached HEAD has no current branch ref, so try the reflog before asking git for the commit
+            commit_date = get_last_commit_date(path)
+        if commit_date is None:
+            commit_date = parse_commit_date(await _run(["git", "log", "-1", "--format=%cI"], path))
+
+    data = {
+        'Repo': repo['name'],
+        'Location': get_repo_location(path),
+        'Push': ahead,
+        'Pull': behind,
+        'Local': '',
+        'Date': commit_date,
+        'DateStr': commit_date.strftime('%Y-%m-%d') if commit_date else '',
+        'DateTimeStr': commit_date.strftime('%Y-%m-%d %H:%M') if commit_date else '',
+        'FullPath': path,
+        'RelativePath': f"~/{relative_path_home}",
+        'ShortRelativePath': get_short_relative_path(path, cwd)
+    }
+
+    # Check for uncommitted local changes
+    if status_output and "ERROR" not in status_output:
+        data['Local'] = 'Y'
+    return data
+
+async def _collect_all(repos, cwd):
+    """Starts a _collect_one task for each repo as it is found and waits for all of them."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REPOS)
+    repos = iter(repos)
+    found_repos = []
+    tasks = []
+    try:
+        # The walk runs in a worker thread so the event loop keeps driving git queries meanwhile
+        while (repo := await asyncio.to_thread(next, repos, None)) is not None:
+            found_repos.append(repo)
+            tasks.append(asyncio.create_task(_collect_one(repo, cwd, semaphore)))
+        if tasks:
+            print(f"Found {len(tasks)} repositories. Fetching repository statuses...")
+    finally:
+        # Always let every started task finish, even if the walk failed, so no git process is
+        # left to be cancelled mid-flight and one failing repo can't take the others down
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
-def get_summary_data(repo_list, cwd):
-    """Gathers concise status data for a list of repositories."""
     repo_data = []
-    for repo in repo_list:
-        path = repo['path']
-        relative_path_home = os.path.relpath(path, HOME_DIR)
-        commit_date = get_last_commit_date(path)
-
-        data = {
-            'Repo': repo['name'],
-            'Location': get_repo_location(path),
-            'Push': 0,
-            'Pull': 0,
-            'Local': '',
-            'Date': commit_date,
-            'DateStr': commit_date.strftime('%Y-%m-%d') if commit_date else '',
-            'DateTimeStr': commit_date.strftime('%Y-%m-%d %H:%M') if commit_date else '',
-            'FullPath': path,
-            'RelativePath': f"~/{relative_path_home}",
-            'ShortRelativePath': get_short_relative_path(path, cwd)
-        }
-
-        # Check for uncommitted local changes
-        status_output = run_command("git status -s", path)
-        if status_output and "ERROR" not in status_output:
-            data['Local'] = 'Y'
-
-        # Check for ahead/behind commits
-        branch_output = run_command("git branch -vv", path)
-        if "ERROR" not in branch_output:
-            for line in branch_output.split('\n'):
-                if line.startswith('*'):
-                    ahead_match = re.search(r'ahead (\d+)', line)
-                    behind_match = re.search(r'behind (\d+)', line)
-                    if ahead_match:
-                        data['Push'] = int(ahead_match.group(1))
-                    if behind_match:
-                        data['Pull'] = int(behind_match.group(1))
-                    break
-        repo_data.append(data)
+    for repo, result in zip(found_repos, results):
+        if isinstance(result, OSError):
+            # git itself couldn't be spawned, so no repo's status can be trusted
+            raise result
+        if isinstance(result, Exception):
+            print(f"Warning: Failed to get status, skipping: {repo['path']} ({result!r})", file=sys.stderr)
+        elif isinstance(result, BaseException):
+            # Cancellation and interrupts are not per-repo failures
+            raise result
+        else:
+            repo_data.append(result)
     return repo_data
 
+def get_summary_data(repos, cwd):
+    """Gathers concise status data for repositories concurrently, querying each as soon as it is found."""
+    try:
+        return asyncio.run(_collect_all(repos, cwd))
+    except OSError as e:
+        print(f"Error: Could not run git ({e}).", file=sys.stderr)
+        print("Please make sure git is installed and on your PATH.", file=sys.stderr)
+        sys.exit(1)
+
 def check_detailed_status(repo_path, repo_name):
     """The original detailed status check function."""
     print(f"--- Detailed Status: {repo_name} ({repo_path}) ---")
-    run_command("git fetch --all", repo_path)
+    run_command(["git", "fetch", "--all"], repo_path)
     
-    status_output = run_command("git status -s", repo_path)
+    status_output = run_command(["git", "status", "-s"], repo_path)
     if status_output and "ERROR" not in status_output:
         print(f"\n  Local Changes (Uncommitted):\n    {status_output.replace(os.linesep, f'{os.linesep}    ')}")
 
-    branch_output = run_command("git branch -vv", repo_path)
+    branch_output = run_command(["git", "branch", "-vv"], repo_path)
     if "ERROR" not in branch_output:
         print(f"\n  Branch Sync Status:\n    {branch_output.replace(os.linesep, f'{os.linesep}    ')}")
     print("-" * 50 + "\n")
@@ -165,11 +364,11 @@ def parse_shortstat(stat_string):
     if "ERROR" in stat_string or not stat_string:
         return 0, 0
     
-    ins_match = re.search(r'(\d+) insertion', stat_string)
+    ins_match = _INS_RE.search(stat_string)
     if ins_match:
         insertions = int(ins_match.group(1))
         
-    del_match = re.search(r'(\d+) deletion', stat_string)
+    del_match = _DEL_RE.search(stat_string)
     if del_match:
         deletions = int(del_match.group(1))
         
@@ -186,35 +385,35 @@ def compare_repositories(path_a, path_b):
     temp_remote_name = "_auditor_temp_remote"
     
     print("Fetching histories to find common ancestor...")
-    run_command(f"git remote add {temp_remote_name} \"{os.path.abspath(path_b)}\"", path_a)
-    fetch_result = run_command(f"git fetch {temp_remote_name}", path_a)
+    run_command(["git", "remote", "add", temp_remote_name, os.path.abspath(path_b)], path_a)
+    fetch_result = run_command(["git", "fetch", temp_remote_name], path_a)
     
     if "ERROR" in fetch_result:
         print(f"Failed to fetch from temporary remote: {fetch_result}", file=sys.stderr)
-        run_command(f"git remote remove {temp_remote_name}", path_a)
+        run_command(["git", "remote", "remove", temp_remote_name], path_a)
         return
 
-    branch_a = run_command("git rev-parse --abbrev-ref HEAD", path_a)
-    branch_b = run_command("git rev-parse --abbrev-ref HEAD", path_b)
+    branch_a = run_command(["git", "rev-parse", "--abbrev-ref", "HEAD"], path_a)
+    branch_b = run_command(["git", "rev-parse", "--abbrev-ref", "HEAD"], path_b)
 
-    merge_base_cmd = f"git merge-base {branch_a} {temp_remote_name}/{branch_b}"
+    merge_base_cmd = ["git", "merge-base", branch_a, f"{temp_remote_name}/{branch_b}"]
     merge_base_hash = run_command(merge_base_cmd, path_a)
     
-    run_command(f"git remote remove {temp_remote_name}", path_a)
+    run_command(["git", "remote", "remove", temp_remote_name], path_a)
 
     if "ERROR" in merge_base_hash or not merge_base_hash:
         print("Could not find a common ancestor commit between the current branches.", file=sys.stderr)
         return
 
-    stats_a_str = run_command(f"git diff --shortstat {merge_base_hash}", path_a)
-    stats_b_str = run_command(f"git diff --shortstat {merge_base_hash}", path_b)
+    stats_a_str = run_command(["git", "diff", "--shortstat", merge_base_hash], path_a)
+    stats_b_str = run_command(["git", "diff", "--shortstat", merge_base_hash], path_b)
     
     ins_a, del_a = parse_shortstat(stats_a_str)
     ins_b, del_b = parse_shortstat(stats_b_str)
     total_a = ins_a + del_a
     total_b = ins_b + del_b
 
-    ancestor_info = run_command(f'git show -s --format="%h %s" {merge_base_hash}', path_a)
+    ancestor_info = run_command(["git", "show", "-s", "--format=%h %s", merge_base_hash], path_a)
     
     print("\n" + "=" * 80)
     print(" Repository Divergence Report")
@@ -242,45 +441,12 @@ def compare_repositories(path_a, path_b):
     print("=" * 80 + "\n")
 
 
-def generate_html_report(all_data, latest_in_group_repos, stale_in_group_repos, show_date=False, show_datetime=False):
-    """Generates the main audit HTML report file."""
-    html_rows = ""
-    for data in sorted(all_data, key=lambda x: (x['Repo'].lower(), x['FullPath'])):
-        status_class = "status-ok"
-        if data['Push'] > 0 or data['Pull'] > 0:
-            status_class = "status-problem"
-        elif (data['Repo'], data['FullPath']) in stale_in_group_repos:
-            status_class = "status-stale"
-        elif data['Local'] == 'Y':
-            status_class = "status-warning"
-        
-        is_latest = 'Y' if (data['Repo'], data['FullPath']) in latest_in_group_repos else ''
-        
-        date_cell = ""
-        if show_datetime:
-            date_cell = f"<td>{data['DateTimeStr']}</td>"
-        elif show_date:
-            date_cell = f"<td>{data['DateStr']}</td>"
-
-
-        html_rows += f"""
-        <tr class="{status_class}">
-            <td>{data['Repo']}</td>
-            <td>{data['Location']}</td>
-            <td class="num">{data['Push'] if data['Push'] > 0 else ''}</td>
-            <td class="num">{data['Pull'] if data['Pull'] > 0 else ''}</td>
-            <td class="status">{data['Local']}</td>
-            <td class="status">{is_latest}</td>
-            {date_cell}
-            <td>{data['ShortRelativePath']}</td>
-        </tr>
-        """
-    
-    date_header = ""
-    if show_datetime or show_date:
-        date_header = "<th>Last Commit</th>"
+# Row colour class for each data['_state'], in priority order: needs push/pull,
+# stale vs. group, local changes only, in sync.
+_STATUS_CLASSES = ('', 'status-problem', 'status-stale', 'status-warning', 'status-ok')
 
-    html_template = f"""
+# Static parts of the HTML report; only the table header and rows in between are generated per run.
+_HTML_HEAD = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -288,113 +454,159 @@ def generate_html_report(all_data, latest_in_group_repos, stale_in_group_repos,
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Git Repository Status Report</title>
         <style>
-            body {{ font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif; margin: 0; background-color: #f8f9fa; color: #212529; }}
-            .container {{ margin: 2rem; }}
-            h1, h2 {{ color: #343a40; border-bottom: 2px solid #dee2e6; padding-bottom: 0.5rem; }}
-            .filter-container {{ margin: 1.5rem 0; }}
-            #repoFilter {{ padding: 0.5rem; width: 300px; max-width: 100%; border: 1px solid #ced4da; border-radius: 0.25rem; font-size: 1rem; }}
-            .legend {{ margin-bottom: 1.5rem; padding: 0.75rem; background-color: #e9ecef; border-radius: 0.25rem; font-size: 0.9rem; }}
-            .legend-item {{ margin-right: 1.5rem; display: inline-flex; align-items: center; }}
-            .color-box {{ width: 15px; height: 15px; display: inline-block; margin-right: 0.5rem; border: 1px solid #ccc; vertical-align: middle; }}
-            table {{ width: 100%; border-collapse: collapse; margin-top: 1rem; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-            th, td {{ padding: 0.75rem 1rem; text-align: left; border-bottom: 1px solid #dee2e6; }}
-            thead {{ background-color: #e9ecef; }}
-            th {{ font-weight: 600; cursor: pointer; user-select: none; }}
-            th:hover {{ background-color: #ced4da; }}
-            tbody tr:nth-child(even) {{ background-color: #f8f9fa; }}
-            tbody tr:hover {{ background-color: #e2e6ea; }}
-            .status-problem {{ background-color: #ffebee !important; }}
-            .status-stale {{ background-color: #e3f2fd !important; }}
-            .status-warning {{ background-color: #fffde7 !important; }}
-            .status-ok {{ background-color: #e8f5e9 !important; }}
-            .status {{ text-align: center; font-weight: bold; }}
-            .num {{ text-align: center; }}
-            footer {{ margin-top: 2rem; font-size: 0.8rem; color: #6c757d; }}
+            body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif; margin: 0; background-color: #f8f9fa; color: #212529; }
+            .container { margin: 2rem; }
+            h1, h2 { color: #343a40; border-bottom: 2px solid #dee2e6; padding-bottom: 0.5rem; }
+            .filter-container { margin: 1.5rem 0; }
+            #repoFilter { padding: 0.5rem; width: 300px; max-width: 100%; border: 1px solid #ced4da; border-radius: 0.25rem; font-size: 1rem; }
+            .legend { margin-bottom: 1.5rem; padding: 0.75rem; background-color: #e9ecef; border-radius: 0.25rem; font-size: 0.9rem; }
+            .legend-item { margin-right: 1.5rem; display: inline-flex; align-items: center; }
+            .color-box { width: 15px; height: 15px; display: inline-block; margin-right: 0.5rem; border: 1px solid #ccc; vertical-align: middle; }
+            table { width: 100%; border-collapse: collapse; margin-top: 1rem; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+            th, td { padding: 0.75rem 1rem; text-align: left; border-bottom: 1px solid #dee2e6; }
+            thead { background-color: #e9ecef; }
+            th { font-weight: 600; cursor: pointer; user-select: none; }
+            th:hover { background-color: #ced4da; }
+            tbody tr:nth-child(even) { background-color: #f8f9fa; }
+            tbody tr:hover { background-color: #e2e6ea; }
+            .status-problem { background-color: #ffebee !important; }
+            .status-stale { background-color: #e3f2fd !important; }
+            .status-warning { background-color: #fffde7 !important; }
+            .status-ok { background-color: #e8f5e9 !important; }
+            .status { text-align: center; font-weight: bold; }
+            .num { text-align: center; }
+            footer { margin-top: 2rem; font-size: 0.8rem; color: #6c757d; }
         </style>
     </head>
     <body>
         <div class="container">
             <h1>Git Repository Status Report</h1>
-            <p>Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            <div class="filter-container">
-                <input type="text" id="repoFilter" placeholder="Filter by repository name...">
-            </div>
-            <div class="legend">
-                <strong>Legend:</strong>
-                <span class="legend-item"><span class="color-box status-problem"></span> Needs Push/Pull</span>
-                <span class="legend-item"><span class="color-box status-stale"></span> Stale vs. Group</span>
-                <span class="legend-item"><span class="color-box status-warning"></span> Local Changes Only</span>
-                <span class="legend-item"><span class="color-box status-ok"></span> In Sync</span>
-            </div>
-            <table id="report-table">
-                <thead>
-                    <tr>
-                        <th>Repository</th>
-                        <th>Location</th>
-                        <th class="num">Push</th>
-                        <th class="num">Pull</th>
-                        <th class="status">Local</th>
-                        <th class="status">Latest</th>
-                        {date_header}
-                        <th>Path</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {html_rows}
+"""
+
+_HTML_TAIL = """
                 </tbody>
             </table>
             <footer>Report generated by Git Auditor script. Click headers to sort.</footer>
         </div>
         <script>
             // Simple table sorting script
-            document.querySelectorAll('th').forEach((headerCell, columnIndex) => {{
-                headerCell.addEventListener('click', () => {{
+            document.querySelectorAll('th').forEach((headerCell, columnIndex) => {
+                headerCell.addEventListener('click', () => {
                     const tableElement = headerCell.closest('table');
                     const tbody = tableElement.querySelector('tbody');
                     const rows = Array.from(tbody.querySelectorAll('tr'));
                     const sortDirection = headerCell.classList.contains('sorted-asc') ? 'desc' : 'asc';
                     document.querySelectorAll('th').forEach(th => th.classList.remove('sorted-asc', 'sorted-desc'));
                     headerCell.classList.toggle(sortDirection === 'asc' ? 'sorted-asc' : 'sorted-desc');
-                    rows.sort((a, b) => {{
-                        const aValue = a.children[columnIndex].innerText;
-                        const bValue = b.children[columnIndex].innerText;
-                        const isNum = !isNaN(aValue) && !isNaN(bValue) && aValue.trim() !== '' && bValue.trim() !== '';
-                        if (isNum) {{
-                            return sortDirection === 'asc' ? aValue - bValue : bValue - aValue;
-                        }} else {{
-                            return sortDirection === 'asc' ? aValue.localeCompare(bValue) : bValue.localeCompare(aValue);
-                        }}
-                    }});
-                    tbody.innerHTML = '';
-                    rows.forEach(row => tbody.appendChild(row));
-                }});
-            }});
+                    // Column type comes from the header, and each cell is read once rather than per comparison
+                    const isNum = headerCell.dataset.type === 'num';
+                    const keyedRows = rows.map(row => {
+                        const text = row.children[columnIndex].innerText;
+                        return { row, value: isNum ? (Number(text) || 0) : text };
+                    });
+                    keyedRows.sort((a, b) => {
+                        if (isNum) {
+                            return sortDirection === 'asc' ? a.value - b.value : b.value - a.value;
+                        } else {
+                            return sortDirection === 'asc' ? a.value.localeCompare(b.value) : b.value.localeCompare(a.value);
+                        }
+                    });
+                    // Reorder through a detached fragment so the table is updated in one go
+                    const fragment = document.createDocumentFragment();
+                    keyedRows.forEach(({ row }) => fragment.appendChild(row));
+                    tbody.replaceChildren(fragment);
+                });
+            });
 
             // Live filter script
             const filterInput = document.getElementById('repoFilter');
-            filterInput.addEventListener('keyup', () => {{
+            filterInput.addEventListener('keyup', () => {
                 const filterText = filterInput.value.toLowerCase();
                 const tbody = document.getElementById('report-table').querySelector('tbody');
                 const rows = tbody.querySelectorAll('tr');
-                rows.forEach(row => {{
+                rows.forEach(row => {
                     const repoNameCell = row.querySelector('td:first-child');
-                    if (repoNameCell) {{
+                    if (repoNameCell) {
                         const repoName = repoNameCell.textContent.toLowerCase();
-                        if (repoName.includes(filterText)) {{
+                        if (repoName.includes(filterText)) {
                             row.style.display = '';
-                        }} else {{
+                        } else {
                             row.style.display = 'none';
-                        }}
-                    }}
-                }});
-            }});
+                        }
+                    }
+                });
+            });
         </script>
     </body>
     </html>
     """
-    return html_template
 
 
+def generate_html_report(fileobj, all_data, show_date=False, show_datetime=False):
+    """Writes the main audit HTML report to fileobj, one row at a time."""
+    date_header = ""
+    if show_datetime or show_date:
+        date_header = "<th>Last Commit</th>"
+
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    fileobj.write(_HTML_HEAD)
+    fileobj.write(f"""            <p>Generated on: {now_str}</p>
+            <div class="filter-container">
+                <input type="text" id="repoFilter" placeholder="Filter by repository name...">
+            </div>
+            <div class="legend">
+                <strong>Legend:</strong>
+                <span class="legend-item"><span class="color-box status-problem"></span> Needs Push/Pull</span>
+                <span class="legend-item"><span class="color-box status-stale"></span> Stale vs. Group</span>
+                <span class="legend-item"><span class="color-box status-warning"></span> Local Changes Only</span>
+                <span class="legend-item"><span class="color-box status-ok"></span> In Sync</span>
+            </div>
+            <table id="report-table">
+                <thead>
+                    <tr>
+                        <th>Repository</th>
+                        <th>Location</th>
+                        <th class="num" data-type="num">Push</th>
+                        <th class="num" data-type="num">Pull</th>
+                        <th class="status">Local</th>
+                        <th class="status">Latest</th>
+                        {date_header}
+                        <th>Path</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    """)
+
+    for data in sorted(all_data, key=lambda x: (x['Repo'].lower(), x['FullPath'])):
+        push = data['Push']
+        pull = data['Pull']
+        status_class = _STATUS_CLASSES[data['_state']]
+        
+        is_latest = 'Y' if data['_is_latest'] else ''
+        
+        date_cell = ""
+        if show_datetime:
+            date_cell = f"<td>{data['DateTimeStr']}</td>"
+        elif show_date:
+            date_cell = f"<td>{data['DateStr']}</td>"
+
+
+        fileobj.write(f"""
+        <tr class="{status_class}">
+            <td>{data['Repo']}</td>
+            <td>{data['Location']}</td>
+            <td class="num">{push if push > 0 else ''}</td>
+            <td class="num">{pull if pull > 0 else ''}</td>
+            <td class="status">{data['Local']}</td>
+            <td class="status">{is_latest}</td>
+            {date_cell}
+            <td>{data['ShortRelativePath']}</td>
+        </tr>
+        """)
+
+    fileobj.write(_HTML_TAIL)
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Audit Git repositories. Default is a slim table; use --html for a web report.",
@@ -459,53 +671,55 @@ if __name__ == "__main__":
     else:
         search_paths = ['.']
 
-    all_repos = find_all_repos(search_paths)
+    CWD = os.getcwd()
+    all_data = get_summary_data(find_all_repos(search_paths), CWD)
 
-    if not all_repos:
+    if not all_data:
         print("No Git repositories found in the specified locations.")
         sys.exit(0)
-
-    print("Fetching repository statuses...")
-    CWD = os.getcwd()
-    all_data = get_summary_data(all_repos, CWD)
     
-    repo_groups = {}
+    repo_groups = defaultdict(list)
     for data in all_data:
         base_name = '-'.join(data['Repo'].split('-')[:4])
-        if base_name not in repo_groups:
-            repo_groups[base_name] = []
         repo_groups[base_name].append(data)
 
-    latest_in_group_repos = set()
-    stale_in_group_repos = set()
+    # Repos are keyed by FullPath, which is unique per repo
+    latest_in_group_paths = set()
+    stale_in_group_paths = set()
     for group in repo_groups.values():
-        if len(group) > 1:
-            latest_date_in_group = None
-            latest_repo_obj = None
-            for repo_data in group:
-                if repo_data['Date']:
-                    if latest_date_in_group is None or repo_data['Date'] > latest_date_in_group:
-                        latest_date_in_group = repo_data['Date']
-                        latest_repo_obj = repo_data
-            if latest_repo_obj:
-                latest_key = (latest_repo_obj['Repo'], latest_repo_obj['FullPath'])
-                latest_in_group_repos.add(latest_key)
-                for repo_data in group:
-                    repo_key = (repo_data['Repo'], repo_data['FullPath'])
-                    if repo_key != latest_key:
-                        stale_in_group_repos.add(repo_key)
+        if len(group) < 2:
+            continue
+        dated = [repo_data for repo_data in group if repo_data['Date']]
+        if not dated:
+            continue
+        latest_path = max(dated, key=lambda repo_data: repo_data['Date'])['FullPath']
+        latest_in_group_paths.add(latest_path)
+        stale_in_group_paths.update(
+            repo_data['FullPath'] for repo_data in group if repo_data['FullPath'] != latest_path
+        )
+
+    # Classify each repo once so renderers only look up _STATUS_CLASSES[data['_state']]
+    for data in all_data:
+        data['_is_latest'] = data['FullPath'] in latest_in_group_paths
+        if data['Push'] or data['Pull']:
+            data['_state'] = 1
+        elif data['FullPath'] in stale_in_group_paths:
+            data['_state'] = 2
+        elif data['Local'] == 'Y':
+            data['_state'] = 3
+        else:
+            data['_state'] = 4
 
     if args.detailed:
         print("\n" + "="*60)
         print(" Detailed Status For All Found Repositories")
         print("="*60)
-        for repo in sorted(all_repos, key=lambda x: x['name']):
-            check_detailed_status(repo['path'], repo['name'])
+        for data in sorted(all_data, key=lambda x: x['Repo']):
+            check_detailed_status(data['FullPath'], data['Repo'])
     elif args.html:
-        report_html = generate_html_report(all_data, latest_in_group_repos, stale_in_group_repos, args.date, args.datetime)
         report_filename = "git_report.html"
-        with open(report_filename, "w", encoding="utf-8") as f:
-            f.write(report_html)
+        with open(report_filename, "w", encoding="utf-8", buffering=1 << 20) as f:
+            generate_html_report(f, all_data, args.date, args.datetime)
         print(f"\nHTML report saved to: ./{report_filename}")
     else:
         if 'tabulate' not in sys.modules:
@@ -528,7 +742,7 @@ if __name__ == "__main__":
             headers.append('Path')
             
         for data in sorted(all_data, key=lambda x: (x['Repo'].lower(), x['FullPath'])):
-            is_latest = 'Y' if (data['Repo'], data['FullPath']) in latest_in_group_repos else ''
+            is_latest = 'Y' if data['_is_latest'] else ''
             
             row = [data['Repo'], data['Location'], data['Push'] if data['Push'] > 0 else '', data['Pull'] if data['Pull'] > 0 else '', data['Local'], is_latest]
             
@@ -1,12 +1,21 @@
 #!/usr/bin/env python3
 import os
+import re
 import subprocess
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 # --- Configuration for Condensed Views ---
 DEFAULT_CONDENSED_WIDTH = 40
 SUPER_CONDENSED_WIDTH = 25
 
+# --- Configuration for Parallel Scanning ---
+# 'git status' is bound by subprocess latency, not CPU, so use more threads than cores.
+MAX_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# Matches the two-character XY status code of every tracked entry in porcelain output.
+_CODE_RE = re.compile(rb'(?m)^([^?\n])([^\n])\s')
+
 def truncate(text, max_length):
     """Truncates text if it exceeds max_length, adding '...'."""
     if len(text) > max_length:
@@ -19,21 +28,22 @@ def get_git_status(repo_path):
     """
     try:
         result = subprocess.run(
-            ['git', 'status', '--porcelain=v1', '-b'],
+            ['git', '--no-optional-locks', 'status', '--porcelain=v1', '-b'],
             cwd=repo_path,
             capture_output=True,
-            text=True,
             check=True
         )
     except subprocess.CalledProcessError:
         return None 
 
-    output = result.stdout.strip().split('\n')
+    # Output stays as bytes so the file entries can be counted without splitting into lines
+    output = result.stdout
     if not output:
         return None
+    branch_line, _, entries = output.partition(b'\n')
 
     # --- Parse Branch and Remote Info ---
-    branch_line = output[0]
+    branch_line = branch_line.decode('utf-8', errors='replace').strip()
     if 'No commits yet on' in branch_line:
         branch_name = branch_line.replace('## ', '').strip()
     else:
@@ -48,14 +58,10 @@ def get_git_status(repo_path):
             behind = int(remote_info.split('behind ')[-1].split(',')[0])
 
     # --- Parse File Status ---
-    staged, unstaged, untracked = 0, 0, 0
-    file_lines = output[1:]
-    for line in file_lines:
-        if line.startswith('??'):
-            untracked += 1
-        else:
-            if line[0] != ' ': staged += 1
-            if line[1] != ' ': unstaged += 1
+    untracked = entries.count(b'\n??') + entries.startswith(b'??')
+    codes = _CODE_RE.findall(entries)
+    staged = sum(1 for x, _ in codes if x != b' ')
+    unstaged = sum(1 for _, y in codes if y != b' ')
     
     is_dirty = any([ahead, behind, staged, unstaged, untracked])
 
@@ -102,14 +108,17 @@ def main():
         print(f"Error: Directory not found at '{root_path}'")
         return
 
-    results = []
+    repo_paths = []
     for dirpath, dirnames, _ in os.walk(root_path):
         if '.git' in dirnames:
-            repo_path = dirpath
-            status = get_git_status(repo_path)
+            repo_paths.append(dirpath)
+            dirnames[:] = [] 
+
+    results = []
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        for repo_path, status in zip(repo_paths, pool.map(get_git_status, repo_paths)):
             if status:
                 results.append((os.path.relpath(repo_path, root_path), status))
-            dirnames[:] = [] 
 
     if not results:
         print(f"No git repositories found under '{root_path}'.")